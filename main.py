@@ -1,11 +1,53 @@
+import asyncio
+import hashlib
 import os
-from typing import List, Optional, Literal, Dict, Any
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException
+import re
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import List, Optional, Literal, Dict, Any, Awaitable, Callable
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+import orjson
 from pydantic import BaseModel
+from schemas import ExtractionJob
 
-app = FastAPI(title="DocuParse Pro API", version="0.1.0")
+# Database is optional for this demo; resolve it once instead of per request
+try:
+    from bson import ObjectId
+    from database import create_documents, get_documents, db
+    _db_import_error: Optional[Exception] = None
+except Exception as e:
+    ObjectId = create_documents = get_documents = db = None
+    _db_import_error = e
+
+
+def orjson_default(obj: Any):
+    """Serialize Mongo ObjectId, the one stored type orjson does not handle natively"""
+    if ObjectId is not None and isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class APIResponse(ORJSONResponse):
+    """ORJSONResponse that also serializes Mongo values via orjson_default"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=orjson_default)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await start_job_logger()
+    start_ai_batchers()
+    yield
+    await stop_ai_batchers()
+    await stop_job_logger()
+
+
+app = FastAPI(title="DocuParse Pro API", version="0.1.0", default_response_class=APIResponse, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -14,28 +56,121 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
 
 # Utilities
-ALLOWED_EXTRACT_TYPES = {
+ALLOWED_EXTRACT_TYPES = MappingProxyType({
     "bank_statement": "Bank Statement Converter",
     "invoice": "Invoice Scanner",
     "receipt": "Receipt Scanner",
     "salary_slip": "Salary Slip Converter",
     "credit_card": "Credit Card Statement Converter",
     "table_extract": "Document Table Extractor",
-}
+})
 
 
-def log_job(job_type: str, filename: str, size: Optional[int], status: str, summary: str, meta: Optional[dict] = None):
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Opt-in: count /api/extract uploads from the raw body instead of parsing multipart
+RAW_UPLOADS = os.getenv("RAW_UPLOADS", "").lower() in ("1", "true", "yes")
+RAW_UPLOAD_HEAD_SIZE = 4096  # bytes scanned for the file part's headers
+_PART_HEADERS_RE = re.compile(rb'filename="([^"]*)"[^\r\n]*\r\n(?:Content-Type:[ \t]*([^\r\n]+))?', re.IGNORECASE)
+
+# Job logs are queued and written to Mongo in batches off the request path
+LOG_BATCH_SIZE = 100
+LOG_FLUSH_INTERVAL = 0.25  # seconds
+LOG_QUEUE_MAXSIZE = 10_000  # logs beyond this are dropped while Mongo is slow
+LOG_SHUTDOWN_TIMEOUT = 5.0  # seconds pending logs get to flush on shutdown
+_LOG_STOP = object()
+_log_queue: Optional[asyncio.Queue] = None
+_log_task: Optional[asyncio.Task] = None
+
+
+def _write_job_logs(batch: List[dict]):
     try:
-        from database import create_document
-        from schemas import ExtractionJob
-        doc = ExtractionJob(
-            job_type=job_type, filename=filename, size_bytes=size, status=status, result_summary=summary, meta=meta
-        )
-        create_document("extractionjob", doc)
+        create_documents("extractionjob", batch)
     except Exception:
-        # Database is optional for this demo; ignore errors to keep API responsive
+        # Database is optional for this demo; dropping a batch keeps the API responsive
+        pass
+
+
+async def _next_batch(
+    queue: asyncio.Queue, max_size: int, window: float, stop: Any = None, into: Optional[list] = None
+) -> list:
+    """
+    Wait for one item, then collect more until max_size or window seconds pass.
+    Collection also ends as soon as the stop sentinel (if given) is received.
+    Items are appended to `into` when given, so the caller still holds them if cancelled.
+    """
+    loop = asyncio.get_running_loop()
+    batch = [] if into is None else into
+    batch.append(await queue.get())
+    deadline = loop.time() + window
+    while len(batch) < max_size and (stop is None or batch[-1] is not stop):
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+    return batch
+
+
+async def _flush_job_logs(queue: asyncio.Queue):
+    while True:
+        batch = await _next_batch(queue, LOG_BATCH_SIZE, LOG_FLUSH_INTERVAL, stop=_LOG_STOP)
+        stopping = batch[-1] is _LOG_STOP
+        if stopping:
+            batch.pop()
+        if batch:
+            await asyncio.to_thread(_write_job_logs, batch)
+        if stopping:
+            return
+
+
+async def start_job_logger():
+    global _log_queue, _log_task
+    # No database module, or it loaded without DATABASE_URL/DATABASE_NAME
+    if create_documents is None or db is None:
+        return
+    _log_queue = asyncio.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+    _log_task = asyncio.create_task(_flush_job_logs(_log_queue))
+
+
+async def stop_job_logger():
+    """Stop accepting logs and flush what is queued, dropping the rest after LOG_SHUTDOWN_TIMEOUT"""
+    global _log_queue, _log_task
+    queue, task = _log_queue, _log_task
+    _log_queue = _log_task = None
+    if task is None:
+        return
+
+    async def _drain():
+        await queue.put(_LOG_STOP)
+        await task
+
+    try:
+        await asyncio.wait_for(_drain(), LOG_SHUTDOWN_TIMEOUT)
+    except asyncio.TimeoutError:
+        # Database is optional for this demo; don't hold up shutdown on a slow or unreachable Mongo
+        task.cancel()
+
+
+def log_job(job_type: str, filename: str, size: Optional[int], status: str, summary: str, meta: Optional[dict] = None):
+    if _log_queue is None:
+        return
+    doc = ExtractionJob.trusted(
+        job_type=job_type, filename=filename, size_bytes=size, status=status, result_summary=summary, meta=meta
+    )
+    # Leave out empty fields so stored documents stay small
+    payload = doc.model_dump(mode="python", exclude_none=True)
+    # Stamp when the job ran, not when its batch is flushed
+    payload["created_at"] = datetime.now(timezone.utc)
+    try:
+        _log_queue.put_nowait(payload)
+    except asyncio.QueueFull:
+        # Database is optional for this demo; shed logs rather than grow without bound
         pass
 
 
@@ -49,37 +184,106 @@ def hello():
     return {"message": "Hello from DocuParse Pro backend!"}
 
 
+# Environment does not change at runtime; resolve the /test status fields once
+_DB_URL_SET = bool(os.getenv("DATABASE_URL"))
+_DB_NAME_SET = bool(os.getenv("DATABASE_NAME"))
+_TEST_RESPONSE = {
+    "backend": "✅ Running",
+    "database": "❌ Not Available",
+    "database_url": "✅ Set" if _DB_URL_SET else "❌ Not Set",
+    "database_name": "✅ Set" if _DB_NAME_SET else "❌ Not Set",
+    "connection_status": "Not Connected",
+    "collections": [],
+}
+
+
 @app.get("/test")
 def test_database():
-    response = {
-        "backend": "✅ Running",
-        "database": "❌ Not Available",
-        "database_url": None,
-        "database_name": None,
-        "connection_status": "Not Connected",
-        "collections": [],
-    }
-    try:
-        from database import db
-        if db is not None:
-            response["database"] = "✅ Available"
-            response["database_url"] = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
-            response["database_name"] = db.name if hasattr(db, "name") else "✅ Connected"
-            response["connection_status"] = "Connected"
-            try:
-                response["collections"] = db.list_collection_names()[:10]
-                response["database"] = "✅ Connected & Working"
-            except Exception as e:
-                response["database"] = f"⚠️  Connected but Error: {str(e)[:50]}"
-    except ImportError:
+    response = _TEST_RESPONSE.copy()
+    if isinstance(_db_import_error, ImportError):
         response["database"] = "❌ Database module not found"
-    except Exception as e:
-        response["database"] = f"❌ Error: {str(e)[:50]}"
-    response["database_url"] = "✅ Set" if os.getenv("DATABASE_URL") else "❌ Not Set"
-    response["database_name"] = "✅ Set" if os.getenv("DATABASE_NAME") else "❌ Not Set"
+    elif _db_import_error is not None:
+        response["database"] = f"❌ Error: {str(_db_import_error)[:50]}"
+    elif db is not None:
+        response["database"] = "✅ Available"
+        response["connection_status"] = "Connected"
+        try:
+            response["collections"] = db.list_collection_names()[:10]
+            response["database"] = "✅ Connected & Working"
+        except Exception as e:
+            response["database"] = f"⚠️  Connected but Error: {str(e)[:50]}"
     return response
 
 
+# Demo outputs per tool
+_DEMO_PAYLOADS: Dict[str, Dict[str, Any]] = {
+    "bank_statement": {
+        "account_name": "Demo Account",
+        "account_number": "XXXX-1234",
+        "currency": "USD",
+        "transactions": [
+            {"date": "2025-01-04", "description": "Coffee Shop", "debit": 4.5, "credit": 0.0, "balance": 1025.5},
+            {"date": "2025-01-06", "description": "Salary", "debit": 0.0, "credit": 3000.0, "balance": 4025.5},
+        ],
+    },
+    "credit_card": {
+        "cardholder": "Demo User",
+        "last4": "4242",
+        "currency": "USD",
+        "transactions": [
+            {"date": "2025-01-03", "merchant": "Online Store", "amount": -89.99, "category": "Shopping"},
+            {"date": "2025-01-07", "merchant": "Airline", "amount": -240.0, "category": "Travel"},
+        ],
+    },
+    "invoice": {
+        "merchant": "Acme Corp",
+        "invoice_number": "INV-1001",
+        "issue_date": "2025-01-02",
+        "due_date": "2025-01-16",
+        "items": [
+            {"description": "Widget A", "qty": 2, "price": 49.99, "total": 99.98},
+            {"description": "Service Fee", "qty": 1, "price": 15.0, "total": 15.0},
+        ],
+        "subtotal": 114.98,
+        "tax": 9.2,
+        "grand_total": 124.18,
+    },
+    "receipt": {
+        "merchant": "Corner Market",
+        "date": "2025-01-05",
+        "items": [
+            {"name": "Bananas", "qty": 3, "unit_price": 0.59, "total": 1.77},
+            {"name": "Milk", "qty": 1, "unit_price": 2.49, "total": 2.49},
+        ],
+        "total": 4.26,
+    },
+    "salary_slip": {
+        "employee": "Demo Employee",
+        "month": "2025-01",
+        "earnings": {"basic": 2500.0, "hra": 800.0, "bonus": 200.0},
+        "deductions": {"tax": 450.0, "insurance": 50.0},
+        "net_pay": 3000.0,
+    },
+    "table_extract": {
+        "tables": [
+            {
+                "name": "Table 1",
+                "columns": ["Date", "Description", "Amount"],
+                "rows": [
+                    ["2025-01-01", "Opening Balance", "1000.00"],
+                    ["2025-01-02", "Subscription", "-12.00"],
+                ],
+            }
+        ]
+    },
+}
+
+# Pre-serialized once so each request only splices the bytes into the envelope
+_DEMO_DATA: Dict[str, orjson.Fragment] = {
+    job_type: orjson.Fragment(orjson.dumps(demo_data)) for job_type, demo_data in _DEMO_PAYLOADS.items()
+}
+
+
 # Models
 class ExtractResponse(BaseModel):
     tool: str
@@ -90,139 +294,202 @@ class ExtractResponse(BaseModel):
     data: Dict[str, Any]
 
 
-@app.post("/api/extract/{job_type}", response_model=ExtractResponse)
+ExtractJobType = Literal[
+    "bank_statement",
+    "invoice",
+    "receipt",
+    "salary_slip",
+    "credit_card",
+    "table_extract",
+]
+
+
+def _extract_response(job_type: str, filename: str, size: int, content_type: Optional[str]):
+    tool = ALLOWED_EXTRACT_TYPES[job_type]
+    summary = f"Parsed {tool} for {filename} (demo)"
+    log_job(job_type, filename, size, "success", summary, {"content_type": content_type} if content_type else None)
+
+    return APIResponse(
+        {
+            "tool": tool,
+            "filename": filename,
+            "size_bytes": size,
+            "content_type": content_type,
+            "summary": summary,
+            "data": _DEMO_DATA[job_type],
+        }
+    )
+
+
 async def extract_document(
-    job_type: Literal[
-        "bank_statement",
-        "invoice",
-        "receipt",
-        "salary_slip",
-        "credit_card",
-        "table_extract",
-    ],
+    job_type: ExtractJobType,
     file: UploadFile = File(...),
     options: Optional[str] = Form(None),
 ):
-    if job_type not in ALLOWED_EXTRACT_TYPES:
-        raise HTTPException(status_code=400, detail="Unsupported job type")
-
-    # Read file bytes to simulate processing (not stored)
-    content = await file.read()
-    size = len(content)
-
-    # Create demo outputs per tool
-    demo_data: Dict[str, Any]
-    if job_type == "bank_statement":
-        demo_data = {
-            "account_name": "Demo Account",
-            "account_number": "XXXX-1234",
-            "currency": "USD",
-            "transactions": [
-                {"date": "2025-01-04", "description": "Coffee Shop", "debit": 4.5, "credit": 0.0, "balance": 1025.5},
-                {"date": "2025-01-06", "description": "Salary", "debit": 0.0, "credit": 3000.0, "balance": 4025.5},
-            ],
-        }
-    elif job_type == "credit_card":
-        demo_data = {
-            "cardholder": "Demo User",
-            "last4": "4242",
-            "currency": "USD",
-            "transactions": [
-                {"date": "2025-01-03", "merchant": "Online Store", "amount": -89.99, "category": "Shopping"},
-                {"date": "2025-01-07", "merchant": "Airline", "amount": -240.0, "category": "Travel"},
-            ],
-        }
-    elif job_type == "invoice":
-        demo_data = {
-            "merchant": "Acme Corp",
-            "invoice_number": "INV-1001",
-            "issue_date": "2025-01-02",
-            "due_date": "2025-01-16",
-            "items": [
-                {"description": "Widget A", "qty": 2, "price": 49.99, "total": 99.98},
-                {"description": "Service Fee", "qty": 1, "price": 15.0, "total": 15.0},
-            ],
-            "subtotal": 114.98,
-            "tax": 9.2,
-            "grand_total": 124.18,
-        }
-    elif job_type == "receipt":
-        demo_data = {
-            "merchant": "Corner Market",
-            "date": "2025-01-05",
-            "items": [
-                {"name": "Bananas", "qty": 3, "unit_price": 0.59, "total": 1.77},
-                {"name": "Milk", "qty": 1, "unit_price": 2.49, "total": 2.49},
-            ],
-            "total": 4.26,
-        }
-    elif job_type == "salary_slip":
-        demo_data = {
-            "employee": "Demo Employee",
-            "month": "2025-01",
-            "earnings": {"basic": 2500.0, "hra": 800.0, "bonus": 200.0},
-            "deductions": {"tax": 450.0, "insurance": 50.0},
-            "net_pay": 3000.0,
-        }
-    else:  # table_extract
-        demo_data = {
-            "tables": [
-                {
-                    "name": "Table 1",
-                    "columns": ["Date", "Description", "Amount"],
-                    "rows": [
-                        ["2025-01-01", "Opening Balance", "1000.00"],
-                        ["2025-01-02", "Subscription", "-12.00"],
-                    ],
-                }
-            ]
-        }
+    # Read file bytes in chunks to simulate processing (not stored)
+    size = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        size += len(chunk)
 
-    summary = f"Parsed {ALLOWED_EXTRACT_TYPES[job_type]} for {file.filename} (demo)"
-    log_job(job_type, file.filename, size, "success", summary, {"content_type": file.content_type})
+    return _extract_response(job_type, file.filename, size, file.content_type)
 
-    return ExtractResponse(
-        tool=ALLOWED_EXTRACT_TYPES[job_type],
-        filename=file.filename,
-        size_bytes=size,
-        content_type=file.content_type,
-        summary=summary,
-        data=demo_data,
-    )
+
+async def extract_document_raw(job_type: ExtractJobType, request: Request):
+    """
+    Count upload bytes straight off the ASGI stream, skipping multipart parsing.
+    size_bytes is the whole request body, so it includes the multipart framing.
+    """
+    if not request.headers.get("content-type", "").lower().startswith("multipart/form-data"):
+        raise HTTPException(status_code=422, detail="Expected a multipart/form-data upload")
+
+    size = 0
+    head = b""
+    async for chunk in request.stream():
+        if len(head) < RAW_UPLOAD_HEAD_SIZE:
+            head += chunk[: RAW_UPLOAD_HEAD_SIZE - len(head)]
+        size += len(chunk)
+
+    match = _PART_HEADERS_RE.search(head)
+    if not match:
+        raise HTTPException(status_code=422, detail="No file part found in upload")
+    filename = match.group(1).decode("utf-8", "replace")
+    content_type = match.group(2).decode("latin-1").strip() if match.group(2) else None
+
+    return _extract_response(job_type, filename, size, content_type)
+
+
+# The model only documents the response in OpenAPI; it is never used to validate or encode it
+app.post("/api/extract/{job_type}", responses={200: {"model": ExtractResponse}})(
+    extract_document_raw if RAW_UPLOADS else extract_document
+)
+
+
+JOBS_MAX_LIMIT = 200
+# Job metadata is not shown in listings, so don't pull it from Mongo
+_JOBS_PROJECTION = {"meta": False}
 
 
 @app.get("/api/jobs")
 async def list_jobs(limit: int = 20):
+    if get_documents is None:
+        return APIResponse({"items": []})
+    limit = max(1, min(limit, JOBS_MAX_LIMIT))
     try:
-        from database import get_documents
-        docs = get_documents("extractionjob", limit=limit)
-        # Convert ObjectId and datetime to strings
-        def _clean(d: dict):
-            out = {}
-            for k, v in d.items():
-                if hasattr(v, "isoformat"):
-                    out[k] = v.isoformat()
-                else:
-                    out[k] = str(v) if k == "_id" else v
-            return out
-        return {"items": [_clean(doc) for doc in docs]}
+        # pymongo is blocking; keep it off the event loop
+        docs = await asyncio.to_thread(
+            get_documents, "extractionjob", limit=limit, projection=_JOBS_PROJECTION
+        )
+        # orjson encodes datetimes natively; ObjectId goes through orjson_default
+        return APIResponse({"items": docs})
     except Exception:
-        return {"items": []}
+        return APIResponse({"items": []})
 
 
 # Generative AI stubs (no external calls, privacy-friendly demo)
+# AI requests arriving within BATCH_WINDOW_MS are grouped into one model call; 0 disables batching
+BATCH_WINDOW_MS = float(os.getenv("BATCH_WINDOW_MS", "0"))
+AI_BATCH_SIZE = 32
+AI_SHUTDOWN_TIMEOUT = 5.0  # seconds queued AI requests get to finish on shutdown
+_BATCH_STOP = object()
+
+
+class MicroBatcher:
+    """
+    Group concurrent submissions and resolve them from a single batch call.
+    Batching runs between start() and close(); otherwise each item is handled on its own.
+    """
+
+    def __init__(self, handler: Callable[[list], Awaitable[list]], window_ms: float, max_size: int):
+        self._handler = handler
+        self._window = window_ms / 1000
+        self._max_size = max_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._window > 0:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run(self._queue))
+
+    async def close(self):
+        """Let queued items finish, failing whatever is left after AI_SHUTDOWN_TIMEOUT"""
+        task, queue = self._task, self._queue
+        self._task = self._queue = None
+        if task is None:
+            return
+        queue.put_nowait(_BATCH_STOP)
+        try:
+            await asyncio.wait_for(task, AI_SHUTDOWN_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+        while not queue.empty():
+            entry = queue.get_nowait()
+            if entry is not _BATCH_STOP:
+                self._fail([entry], RuntimeError("Batcher closed"))
+
+    async def submit(self, item: Any) -> Any:
+        if self._task is None or self._task.done():
+            return (await self._handler([item]))[0]
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def _run(self, queue: asyncio.Queue):
+        while True:
+            batch, stopping = [], False
+            try:
+                await _next_batch(queue, self._max_size, self._window, stop=_BATCH_STOP, into=batch)
+                stopping = batch[-1] is _BATCH_STOP
+                if stopping:
+                    batch.pop()
+                if not batch:
+                    return
+                results = await self._handler([item for item, _ in batch])
+                if len(results) != len(batch):
+                    raise RuntimeError(f"Batch handler returned {len(results)} results for {len(batch)} items")
+            except asyncio.CancelledError:
+                self._fail(batch, RuntimeError("Batcher closed"))
+                raise
+            except Exception as e:
+                self._fail(batch, e)
+            else:
+                for (_, future), result in zip(batch, results):
+                    if not future.done():
+                        future.set_result(result)
+            if stopping:
+                return
+
+    @staticmethod
+    def _fail(batch: list, exc: Exception):
+        for entry in batch:
+            if entry is not _BATCH_STOP and not entry[1].done():
+                entry[1].set_exception(exc)
+
+
 class ChatRequest(BaseModel):
     question: str
 
 
-@app.post("/api/ai/chat")
-async def chat_with_pdf(req: ChatRequest):
-    answer = (
+async def _answer_question(question: str) -> str:
+    # Placeholder for index -> embed -> LLM; real sub-calls slot in here
+    return (
         "This is a demo response. In the full version, the system would index your PDF and answer using its content.\n"
-        f"Question: {req.question}\n"
+        f"Question: {question}\n"
         "Answer: Based on a quick scan, the document discusses totals, dates, and line items."
     )
-    return {"answer": answer}
+
+
+async def _answer_questions(questions: List[str]) -> List[str]:
+    return await asyncio.gather(*[_answer_question(q) for q in questions])
+
+
+_chat_batcher = MicroBatcher(_answer_questions, BATCH_WINDOW_MS, AI_BATCH_SIZE)
+
+
+@app.post("/api/ai/chat")
+async def chat_with_pdf(req: ChatRequest):
+    answer = await _chat_batcher.submit(req.question)
+    return APIResponse({"answer": answer})
 
 
 class SummarizeRequest(BaseModel):
@@ -230,13 +497,33 @@ class SummarizeRequest(BaseModel):
     max_sentences: int = 3
 
 
+async def _summarize_text(text: str, max_sentences: int) -> str:
+    # maxsplit stops scanning once enough sentences are found
+    snippet = text.strip().split(". ", max_sentences)[:max_sentences]
+    return ". ".join(snippet) or "No content provided."
+
+
+async def _summarize_texts(requests: List[SummarizeRequest]) -> List[str]:
+    return await asyncio.gather(*[_summarize_text(r.text, r.max_sentences) for r in requests])
+
+
+_summarize_batcher = MicroBatcher(_summarize_texts, BATCH_WINDOW_MS, AI_BATCH_SIZE)
+
+
 @app.post("/api/ai/summarize")
 async def summarize(req: SummarizeRequest):
-    snippet = req.text.strip().split(". ")[: req.max_sentences]
-    summary = ". ".join(snippet)
-    if not summary:
-        summary = "No content provided."
-    return {"summary": summary}
+    summary = await _summarize_batcher.submit(req)
+    return APIResponse({"summary": summary})
+
+
+def start_ai_batchers():
+    _chat_batcher.start()
+    _summarize_batcher.start()
+
+
+async def stop_ai_batchers():
+    await _chat_batcher.close()
+    await _summarize_batcher.close()
 
 
 class TranslateRequest(BaseModel):
@@ -246,23 +533,34 @@ class TranslateRequest(BaseModel):
 
 @app.post("/api/ai/translate")
 async def translate(req: TranslateRequest):
-    return {"translated": f"[Translated to {req.target_lang}] {req.text}"}
+    return APIResponse({"translated": f"[Translated to {req.target_lang}] {req.text}"})
 
 
 class PPTRequest(BaseModel):
     text: str
 
 
+# The demo outline ignores its input, so serve the same pre-encoded body every time
+_PPT_BYTES = orjson.dumps(
+    {
+        "outline": [
+            "Title: Key Insights",
+            "Slide 1: Overview",
+            "Slide 2: Data Tables",
+            "Slide 3: Totals & Trends",
+            "Slide 4: Conclusions",
+        ]
+    }
+)
+_PPT_HEADERS = {
+    "ETag": f'"{hashlib.sha1(_PPT_BYTES).hexdigest()[:16]}"',
+    "Cache-Control": "public, max-age=86400",
+}
+
+
 @app.post("/api/ai/ppt-outline")
 async def ppt_outline(req: PPTRequest):
-    lines = [
-        "Title: Key Insights",
-        "Slide 1: Overview",
-        "Slide 2: Data Tables",
-        "Slide 3: Totals & Trends",
-        "Slide 4: Conclusions",
-    ]
-    return {"outline": lines}
+    return Response(content=_PPT_BYTES, media_type="application/json", headers=_PPT_HEADERS)
 
 
 class ImageGenRequest(BaseModel):
@@ -272,10 +570,13 @@ class ImageGenRequest(BaseModel):
 @app.post("/api/ai/image-gen")
 async def image_gen(req: ImageGenRequest):
     # Return a placeholder image URL
-    return {"image_url": "https://picsum.photos/seed/docuparse/1024/768", "prompt": req.prompt}
+    return APIResponse({"image_url": "https://picsum.photos/seed/docuparse/1024/768", "prompt": req.prompt})
 
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    workers = int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+    # Multiple workers need the app as an import string so each process can load it
+    # "auto" picks uvloop/httptools when installed and falls back to asyncio/h11 otherwise
+    uvicorn.run("main:app", host="0.0.0.0", port=port, loop="auto", http="auto", workers=workers)
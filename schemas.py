@@ -5,13 +5,15 @@ Pydantic models that define collections used by the app.
 Each class name lowercased becomes its collection name.
 """
 from typing import Optional, Literal, Any, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 class ExtractionJob(BaseModel):
     """
     Stores a log of a document extraction/analysis job
     Collection name: "extractionjob" (lowercase of class)
     """
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     job_type: Literal[
         "bank_statement",
         "invoice",
@@ -29,6 +31,11 @@ class ExtractionJob(BaseModel):
     result_summary: Optional[str] = Field(None, description="Short human summary of result")
     meta: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata for the job")
 
+    @classmethod
+    def trusted(cls, **kw):
+        """Build from server-produced values without running validation"""
+        return cls.model_construct(**kw)
+
 class User(BaseModel):
     name: str = Field(..., description="Full name")
     email: str = Field(..., description="Email address")